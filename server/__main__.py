@@ -1,4 +1,23 @@
+import sys
+
+import anyio
+
 from .app import mcp
 
+
+def main() -> None:
+    # FastMCP.run() starts a plain asyncio loop, so opt into uvloop here
+    try:
+        if sys.platform == "win32":
+            raise ImportError("uvloop does not support Windows")
+        import uvloop  # noqa: F401
+    except ImportError as exc:
+        print(f"uvloop unavailable ({exc}); using the default asyncio loop", file=sys.stderr)
+        mcp.run(transport="streamable-http")
+        return
+
+    anyio.run(mcp.run_streamable_http_async, backend_options={"use_uvloop": True})
+
+
 if __name__ == "__main__":
-    mcp.run(transport="streamable-http")
+    main()
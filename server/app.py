@@ -4,6 +4,8 @@ Run from the repository root:
     uv run examples/snippets/servers/mcpserver_quickstart.py
 """
 
+from types import MappingProxyType
+
 from mcp.server import FastMCP
 
 # Create an MCP server
@@ -24,14 +26,20 @@ def get_greeting(name: str) -> str:
     return f"Hello, {name}!"
 
 
-# Add a prompt
-@mcp.prompt()
-def greet_user(name: str, style: str = "friendly") -> str:
-    """Generate a greeting prompt"""
-    styles = {
+# Greeting styles used by the greet_user prompt
+GREETING_STYLES = MappingProxyType(
+    {
         "friendly": "Please write a warm, friendly greeting",
         "formal": "Please write a formal, professional greeting",
         "casual": "Please write a casual, relaxed greeting",
     }
+)
+
+
+# Add a prompt
+@mcp.prompt()
+def greet_user(name: str, style: str = "friendly") -> str:
+    """Generate a greeting prompt"""
+    greeting = GREETING_STYLES.get(style, GREETING_STYLES["friendly"])
 
-    return f"{styles.get(style, styles['friendly'])} for someone named {name}."
+    return f"{greeting} for someone named {name}."